@@ -1,13 +1,178 @@
+import math
+import os
+
 import pygame
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import moderngl
+except ImportError:
+    moderngl = None
+
+try:
+    import meshoptimizer
+except ImportError:
+    meshoptimizer = None
+
+
+def _project_numpy(verts_h, M, width, height, xs, ys, ws, MT, tv):
+    """
+    NumPy fallback for project() when numba is not installed,
+    MT (4, 4) and tv (N, 4) are preallocated scratch buffers
+    """
+    np.copyto(MT, M.T)
+    np.dot(verts_h, MT, out=tv)
+    ws[:] = tv[:, 3]
+    np.divide(tv[:, :2], tv[:, 3:4], out=tv[:, :2])
+    # NDC -> pixels for x and y at once, broadcast over all vertices, then one typed cast each
+    half = np.array([width * 0.5, height * 0.5], dtype=np.float32)
+    tv[:, :2] *= half
+    tv[:, :2] += half
+    np.copyto(xs, tv[:, 0], casting='unsafe')
+    np.copyto(ys, tv[:, 1], casting='unsafe')
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def project(verts_h, M, width, height, xs, ys, ws):
+        """
+        transform homogeneous vertices by M, divide by w and map to screen pixels,
+        writing the integer coordinates into xs and ys and the clip-space w into ws
+        """
+        half_w = width * 0.5
+        half_h = height * 0.5
+        for i in prange(verts_h.shape[0]):
+            x = verts_h[i, 0]
+            y = verts_h[i, 1]
+            z = verts_h[i, 2]
+            w = M[3, 0] * x + M[3, 1] * y + M[3, 2] * z + M[3, 3]
+            xs[i] = int((M[0, 0] * x + M[0, 1] * y + M[0, 2] * z + M[0, 3]) / w * half_w + half_w)
+            ys[i] = int((M[1, 0] * x + M[1, 1] * y + M[1, 2] * z + M[1, 3]) / w * half_h + half_h)
+            ws[i] = w
+
+    @njit(cache=True)
+    def _draw_line(buf, x0, y0, x1, y1, color):
+        """ clip a segment to the buffer (Liang-Barsky) and rasterize it with Bresenham """
+        max_x = buf.shape[0] - 1
+        max_y = buf.shape[1] - 1
+        fx0 = float(x0)
+        fy0 = float(y0)
+        dx = float(x1) - fx0
+        dy = float(y1) - fy0
+        t0, t1 = 0.0, 1.0
+        for p, q in ((-dx, fx0), (dx, max_x - fx0), (-dy, fy0), (dy, max_y - fy0)):
+            if p == 0:
+                if q < 0:
+                    return
+            else:
+                t = q / p
+                if p < 0:
+                    if t > t1:
+                        return
+                    t0 = max(t0, t)
+                else:
+                    if t < t0:
+                        return
+                    t1 = min(t1, t)
+        x = int(round(fx0 + t0 * dx))
+        y = int(round(fy0 + t0 * dy))
+        x_end = int(round(fx0 + t1 * dx))
+        y_end = int(round(fy0 + t1 * dy))
+
+        step_x = 1 if x_end > x else -1
+        step_y = 1 if y_end > y else -1
+        err_x = abs(x_end - x)
+        err_y = -abs(y_end - y)
+        err = err_x + err_y
+        while True:
+            if 0 <= x <= max_x and 0 <= y <= max_y:
+                buf[x, y] = color
+            if x == x_end and y == y_end:
+                break
+            e2 = 2 * err
+            if e2 >= err_y:
+                err += err_y
+                x += step_x
+            if e2 <= err_x:
+                err += err_x
+                y += step_y
+
+    @njit(cache=True)
+    def draw_triangles(buf, triangles, color):
+        """ rasterize the closed outline of every (3, 2) triangle directly into a pixel buffer """
+        for t in range(triangles.shape[0]):
+            for k in range(3):
+                j = (k + 1) % 3
+                _draw_line(buf, triangles[t, k, 0], triangles[t, k, 1],
+                           triangles[t, j, 0], triangles[t, j, 1], color)
+else:
+    project = None
+    draw_triangles = None
+
+VERTEX_SHADER = '''
+#version 330
+uniform mat4 M;
+in vec3 in_vert;
+void main() {
+    vec4 p = M * vec4(in_vert, 1.0);
+    // the face sits on the +z side of the camera (w < 0); negating x and w keeps the
+    // same projected point as the CPU path with y pointing up, and puts w in front of
+    // the clipper. Depth is flattened since nothing is depth tested.
+    gl_Position = vec4(-p.x, p.y, 0.0, -p.w);
+}
+'''
+
+FRAGMENT_SHADER = '''
+#version 330
+out vec4 color;
+void main() {
+    color = vec4(1.0, 1.0, 1.0, 1.0);
+}
+'''
+
+def _dirty_param(name, *flags):
+    """ attribute that sets each of the given dirty flags whenever it is assigned """
+    attr = '_' + name
+
+    def fset(self, value):
+        setattr(self, attr, value)
+        for flag in flags:
+            setattr(self, flag, True)
+
+    return property(lambda self: getattr(self, attr), fset)
+
 class FaceRenderer:
-    def __init__(self, vertices_file, indices_file):
+    # changing any of these at runtime rebuilds the projection before the next frame
+    fov = _dirty_param('fov', '_proj_dirty', '_view_dirty', '_dirty')
+    aspect_ratio = _dirty_param('aspect_ratio', '_proj_dirty', '_view_dirty', '_dirty')
+    near = _dirty_param('near', '_proj_dirty', '_view_dirty', '_dirty')
+    far = _dirty_param('far', '_proj_dirty', '_view_dirty', '_dirty')
+    # zoom rebuilds projection @ translation, rotation only needs a redraw
+    z_val = _dirty_param('z_val', '_view_dirty', '_dirty')
+    angle_x = _dirty_param('angle_x', '_dirty')
+    angle_y = _dirty_param('angle_y', '_dirty')
+    angle_z = _dirty_param('angle_z', '_dirty')
+
+    def __init__(self, vertices_file, indices_file, use_gpu=False):
         self.vertices_file = vertices_file
         self.indices_file = indices_file
-        self.vertices = []
-        self.indices = []
+        self.verts = None
+        self.idx = None
         self.load_data()
+        # screen coordinate buffers reused every frame
+        self._xs = np.empty(len(self.verts), np.int32)
+        self._ys = np.empty(len(self.verts), np.int32)
+        self._ws = np.empty(len(self.verts), np.float32)
+        self._tri_screen = np.empty((len(self.tri_flat), 2), np.int32)
+        # combined matrix, its transpose and the NumPy fallback's transformed vertices
+        self._M = np.empty((4, 4), np.float32)
+        self._MT = np.empty((4, 4), np.float32)
+        self._tv = np.empty((len(self.verts), 4), np.float32) if project is None else None
         self.fov = 90
         self.aspect_ratio = 1
         self.near = 0.1
@@ -15,30 +180,119 @@ class FaceRenderer:
 
         pygame.init()
         self.width, self.height = 800, 600
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        self.ctx = None
+        if use_gpu:
+            if moderngl is None:
+                raise ImportError('use_gpu=True requires the moderngl package')
+            self.screen = pygame.display.set_mode((self.width, self.height), pygame.OPENGL | pygame.DOUBLEBUF)
+            self.init_gl(moderngl.create_context())
+        else:
+            self.screen = pygame.display.set_mode((self.width, self.height))
+        # pixels2d only supports 8, 16 and 32 bit surfaces, other depths use pygame.draw
+        self._direct_pixels = self.ctx is None and self.screen.get_bytesize() in (1, 2, 4)
         self.clock = pygame.time.Clock()
         self.white = (255, 255, 255)
 
         self.angle_x = 0
         self.angle_y = 0
         self.angle_z = 0
+        # rotation keys -> (axis, angle step)
+        self._key_map = {
+            pygame.K_UP: ('x', 0.1),
+            pygame.K_DOWN: ('x', -0.1),
+            pygame.K_LEFT: ('y', 0.1),
+            pygame.K_RIGHT: ('y', -0.1),
+            pygame.K_z: ('z', 0.1),
+            pygame.K_x: ('z', -0.1),
+        }
         self.z_val = 0.04
 
+        # reusable rotation buffer and cached projection / projection @ translation,
+        # the projection is only rebuilt when fov, aspect ratio, near or far change
+        self._R = np.eye(4, dtype=np.float32)
+        self._projection = None
+        self._proj_dirty = True
+        self._PT = None
+        # set when the zoom changes, _PT is then rebuilt before the next frame
+        self._view_dirty = True
+
         self.font = pygame.font.Font(None, 36)
+        # rendered zoom labels keyed by their text, so the font is only rasterized on change
+        self._zoom_cache = {}
+        # set whenever the view changes, the frame is only redrawn while it is set
+        self._dirty = True
 
     def load_data(self):
         """ load data from file """
-        with open(self.vertices_file, 'r') as f:
-            for line in f:
-                if line.strip():
-                    x, y, z = map(float, line.strip().split(','))
-                    self.vertices.append((x, y, z))
-
-        with open(self.indices_file, 'r') as f:
-            for line in f:
-                if line.strip():
-                    index1, index2, index3 = map(int, line.strip().split(','))
-                    self.indices.append((index1, index2, index3))
+        # contiguous typed arrays instead of lists of tuples
+        self.verts = self.load_array(self.vertices_file, np.float32)
+        # reordered indices are cached under their own name, so a cache written
+        # without meshoptimizer is never reused once it is installed
+        idx_suffix = '.opt.npy' if meshoptimizer is not None else '.npy'
+        self.idx = self.load_array(self.indices_file, np.int32, prepare=self.optimize_indices,
+                                   cache_suffix=idx_suffix)
+        # flattened (3M,) vertex index of every triangle corner
+        self.tri_flat = self.idx.reshape(-1)
+
+        # homogeneous (N, 4) vertex matrix, built once so each frame is a single matmul
+        self.verts_h = np.ones((len(self.verts), 4), dtype=np.float32)
+        self.verts_h[:, :3] = self.verts
+
+    def init_gl(self, ctx):
+        """ upload the mesh to the GPU once and build the shader program """
+        self.ctx = ctx
+        self.prog = ctx.program(vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER)
+        self.vbo = ctx.buffer(np.ascontiguousarray(self.verts, dtype=np.float32).tobytes())
+        # every triangle as its three edges (a, b), (b, c), (c, a)
+        edges = np.ascontiguousarray(self.idx[:, [0, 1, 1, 2, 2, 0]], dtype=np.int32)
+        self.ibo = ctx.buffer(edges.tobytes())
+        self.line_vao = ctx.vertex_array(self.prog, [(self.vbo, '3f', 'in_vert')], self.ibo)
+        self.point_vao = ctx.vertex_array(self.prog, [(self.vbo, '3f', 'in_vert')])
+        # matches the 2x2 pixel footprint of the CPU points mode
+        ctx.point_size = 2.0
+
+    def optimize_indices(self, idx):
+        """
+        reorder triangles so neighbouring ones share recently used vertices, which
+        improves the GPU post-transform cache and the locality of the CPU gathers
+        (needs meshoptimizer, otherwise the order is left unchanged)
+        """
+        if meshoptimizer is None:
+            return idx
+        flat = idx.reshape(-1).astype(np.uint32)
+        reordered = np.empty_like(flat)
+        meshoptimizer.optimize_vertex_cache(reordered, flat, len(flat), len(self.verts))
+        return reordered.astype(np.int32).reshape(-1, 3)
+
+    def load_array(self, path, dtype, prepare=None, cache_suffix='.npy'):
+        """
+        load a comma separated text file as a 2D array, caching it next to the source
+        as a binary file (path + cache_suffix) that is memory-mapped on later runs
+        prepare, if given, is applied to freshly parsed data before it is cached
+        """
+        cache_path = path + cache_suffix
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            try:
+                return np.load(cache_path, mmap_mode='r')
+            except (OSError, ValueError, EOFError):
+                pass  # unreadable or truncated cache, parse the text and rewrite it
+        data = np.loadtxt(path, delimiter=',', dtype=dtype, ndmin=2)
+        if prepare is not None:
+            data = prepare(data)
+        # write to a temporary file and move it into place, so an interrupted save
+        # never leaves a partial cache behind
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.save(f, data)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # read-only location, just parse the text again next time
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return data
 
     def perspective_projection_matrix(self):
         """
@@ -47,13 +301,13 @@ class FaceRenderer:
         Returns:
             - Projection matrix for transforming 3D coordinates to 2D.
         """
-        f = 1 / np.tan(np.radians(self.fov / 2))
+        f = 1 / math.tan(math.radians(self.fov / 2))
         return np.array([
             [f / self.aspect_ratio, 0, 0, 0],
             [0, f, 0, 0],
             [0, 0, (self.far + self.near) / (self.near - self.far), (2 * self.far * self.near) / (self.near - self.far)],
             [0, 0, -1, 0]
-        ])
+        ], dtype=np.float32)
 
     def translate_matrix(self, tx, ty, tz):
         """
@@ -66,63 +320,133 @@ class FaceRenderer:
             [0, 1, 0, ty],
             [0, 0, 1, tz],
             [0, 0, 0, 1]
-        ])
+        ], dtype=np.float32)
 
-    def rotate_x_matrix(self, theta):
+    def rotation_xyz(self, ax, ay, az):
         """
-        rotate on x axis 
-        Rotation equation for x-axis rotation:
-        x' = x
-        y' = y * cos(theta) - z * sin(theta)
-        z' = y * sin(theta) + z * cos(theta)
+        combined rotation R = Rx(ax) @ Ry(ay) @ Rz(az), written in closed form
+        into the reusable self._R buffer
+        Rotation equations for the single-axis rotations:
+        x-axis: y' = y * cos(theta) - z * sin(theta), z' = y * sin(theta) + z * cos(theta)
+        y-axis: x' = x * cos(theta) + z * sin(theta), z' = -x * sin(theta) + z * cos(theta)
+        z-axis: x' = x * cos(theta) - y * sin(theta), y' = x * sin(theta) + y * cos(theta)
         """
-        c = np.cos(theta)
-        s = np.sin(theta)
-        return np.array([
-            [1, 0, 0, 0],
-            [0, c, -s, 0],
-            [0, s, c, 0],
-            [0, 0, 0, 1]
-        ])
+        cx, sx = math.cos(ax), math.sin(ax)
+        cy, sy = math.cos(ay), math.sin(ay)
+        cz, sz = math.cos(az), math.sin(az)
+        R = self._R
+        R[0, 0] = cy * cz
+        R[0, 1] = -cy * sz
+        R[0, 2] = sy
+        R[1, 0] = sx * sy * cz + cx * sz
+        R[1, 1] = cx * cz - sx * sy * sz
+        R[1, 2] = -sx * cy
+        R[2, 0] = sx * sz - cx * sy * cz
+        R[2, 1] = sx * cz + cx * sy * sz
+        R[2, 2] = cx * cy
+        return R
 
-    def rotate_y_matrix(self, theta):
-        """
-        rotate on y axis 
-        x' = x * cos(theta) + z * sin(theta)
-        y' = y
-        z' = -x * sin(theta) + z * cos(theta)
-        """
-        c = np.cos(theta)
-        s = np.sin(theta)
-        return np.array([
-            [c, 0, s, 0],
-            [0, 1, 0, 0],
-            [-s, 0, c, 0],
-            [0, 0, 0, 1]
-        ])
-
-    def rotate_z_matrix(self, theta):
-        """ 
-        rotate on z axis 
-        Rotation equation for z-axis rotation:
-        x' = x * cos(theta) - y * sin(theta)
-        y' = x * sin(theta) + y * cos(theta)
-        z' = z
-        """
-        c = np.cos(theta)
-        s = np.sin(theta)
-        return np.array([
-            [c, -s, 0, 0],
-            [s, c, 0, 0],
-            [0, 0, 1, 0],
-            [0, 0, 0, 1]
-        ])
+    def update_view_matrix(self):
+        """ recompute the cached projection @ translation, only needed when zoom or projection changes """
+        if self._proj_dirty:
+            self._projection = self.perspective_projection_matrix()
+            self._proj_dirty = False
+        self._PT = self._projection @ self.translate_matrix(0, 0, 10 * self.z_val)
+        self._view_dirty = False
+
+    def mvp_matrix(self):
+        """ combined projection @ translation @ rotation, a single 4x4 matmul per frame """
+        if self._view_dirty:
+            self.update_view_matrix()
+        return np.dot(self._PT, self.rotation_xyz(self.angle_x, self.angle_y, self.angle_z), out=self._M)
 
     def draw_zoom_value(self):
         """ drawing zoom value on screen lower left """
-        zoom_text = self.font.render(f'Zoom: {100.00-self.z_val:.3f}', True, (255, 0, 0))
+        key = f'{100.00-self.z_val:.3f}'
+        zoom_text = self._zoom_cache.get(key)
+        if zoom_text is None:
+            if len(self._zoom_cache) >= 16:
+                self._zoom_cache.clear()
+            zoom_text = self._zoom_cache[key] = self.font.render(f'Zoom: {key}', True, (255, 0, 0))
         self.screen.blit(zoom_text, (10, self.height - 40))
 
+    def render_frame(self, mode):
+        """ project the mesh with the current view and draw it to the screen """
+        self.screen.fill((0, 0, 0))
+        # combine all transforms once, then project every vertex in a single matmul
+        M = self.mvp_matrix()
+        if project is not None:
+            project(self.verts_h, M, self.width, self.height, self._xs, self._ys, self._ws)
+        else:
+            _project_numpy(self.verts_h, M, self.width, self.height, self._xs, self._ys, self._ws,
+                           self._MT, self._tv)
+        xs, ys = self._xs, self._ys
+        # vertices in front of the near plane and between the near and far planes; the
+        # face sits on the +z side of the camera, so w = -z is negative for everything in view
+        in_front = self._ws < -self.near
+        in_depth = in_front & (self._ws > -self.far)
+
+        # select the mode for displaying the object
+        if mode == 'points':
+            px, py = xs[in_depth], ys[in_depth]
+            if self._direct_pixels:
+                color = self.screen.map_rgb(self.white)
+                buf = pygame.surfarray.pixels2d(self.screen)
+                # scatter a 2x2 stamp per vertex, the same pixels pygame.draw.circle uses for radius 1
+                for dx, dy in ((0, 0), (-1, 0), (0, -1), (-1, -1)):
+                    sx, sy = px + dx, py + dy
+                    inside = (sx >= 0) & (sx < self.width) & (sy >= 0) & (sy < self.height)
+                    buf[sx[inside], sy[inside]] = color
+                del buf  # release the surface lock before blitting/flipping
+            else:
+                for x, y in zip(px.tolist(), py.tolist()):
+                    pygame.draw.circle(self.screen, self.white, (x, y), 1)
+        elif mode == 'wireframe':
+            # gather the (M, 3, 2) screen coordinates of every triangle in one shot
+            np.take(xs, self.tri_flat, out=self._tri_screen[:, 0])
+            np.take(ys, self.tri_flat, out=self._tri_screen[:, 1])
+            triangles = self._tri_screen.reshape(-1, 3, 2)
+            # drop triangles whose bounding box is entirely off screen, that have a
+            # vertex behind the near plane (its projection would be mirrored) or
+            # whose vertices all lie beyond the far plane
+            lo = triangles.min(axis=1)
+            hi = triangles.max(axis=1)
+            visible = ((hi[:, 0] >= 0) & (lo[:, 0] < self.width) &
+                       (hi[:, 1] >= 0) & (lo[:, 1] < self.height) &
+                       in_front[self.idx].all(axis=1) &
+                       in_depth[self.idx].any(axis=1))
+            triangles = triangles[visible]
+            if draw_triangles is not None and self._direct_pixels:
+                buf = pygame.surfarray.pixels2d(self.screen)
+                draw_triangles(buf, triangles, self.screen.map_rgb(self.white))
+                del buf  # release the surface lock before blitting/flipping
+            else:
+                # one bulk conversion to Python ints, and the draw call and its
+                # arguments looked up once instead of per triangle
+                draw_lines, screen, white = pygame.draw.lines, self.screen, self.white
+                for triangle in triangles.tolist():
+                    draw_lines(screen, white, True, triangle, 1)
+        else:
+            print('Incorrect disply mode for object, select : points or wireframe.')
+
+        self.draw_zoom_value()
+
+    def render_frame_gl(self, mode):
+        """ draw the mesh on the GPU, only the combined matrix is uploaded per frame """
+        M = self.mvp_matrix()
+        # GLSL reads matrices column-major
+        np.copyto(self._MT, M.T)
+        self.prog['M'].write(self._MT)
+        self.ctx.clear(0.0, 0.0, 0.0)
+        if mode == 'points':
+            self.point_vao.render(moderngl.POINTS)
+        elif mode == 'wireframe':
+            self.line_vao.render(moderngl.LINES)
+        else:
+            print('Incorrect disply mode for object, select : points or wireframe.')
+        # the OpenGL window cannot blit font surfaces, show the zoom in the title instead
+        pygame.display.set_caption(f'Zoom: {100.00-self.z_val:.3f}')
+
     def run(self, mode):
         """ run rendering loop """
         running = True
@@ -131,19 +455,9 @@ class FaceRenderer:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
-                    
-                    if event.key == pygame.K_UP:
-                        self.angle_x += 0.1
-                    elif event.key == pygame.K_DOWN:
-                        self.angle_x -= 0.1
-                    elif event.key == pygame.K_LEFT:
-                        self.angle_y += 0.1
-                    elif event.key == pygame.K_RIGHT:
-                        self.angle_y -= 0.1
-                    elif event.key == pygame.K_z:
-                        self.angle_z += 0.1
-                    elif event.key == pygame.K_x:
-                        self.angle_z -= 0.1
+                    axis, delta = self._key_map.get(event.key, (None, 0))
+                    if axis:
+                        setattr(self, 'angle_' + axis, getattr(self, 'angle_' + axis) + delta)
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 4:  # Scroll up
                         if self.z_val - 0.01 <= 0:
@@ -152,47 +466,17 @@ class FaceRenderer:
                             self.z_val -= 0.01
                     elif event.button == 5:  # Scroll down
                         self.z_val += 0.01
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self._dirty = True
 
-            self.screen.fill((0, 0, 0))
-            # Here '@' operator is used for efficient matrix multiplication 
-            projection_matrix = self.perspective_projection_matrix()
-            translation_matrix = self.translate_matrix(0, 0, 10 * self.z_val)
-            rotation_matrix = (
-                self.rotate_x_matrix(self.angle_x) @
-                self.rotate_y_matrix(self.angle_y) @
-                self.rotate_z_matrix(self.angle_z)
-            )
-            # select the mode for displaying the object
-            if mode == 'points':
-                for vertex in self.vertices:
-                    transformed_vertex = projection_matrix @ translation_matrix @ rotation_matrix @ np.array(vertex + (1,))
-                    transformed_vertex = transformed_vertex[:3] / transformed_vertex[3]
-                    x, y = int(transformed_vertex[0] * self.width / 2 + self.width / 2), int(transformed_vertex[1] * self.height / 2 + self.height / 2)
-                    pygame.draw.circle(self.screen, self.white, (x, y), 1)
-            elif mode == 'wireframe':
-                for index in self.indices:
-                    vertex1 = self.vertices[index[0]]
-                    vertex2 = self.vertices[index[1]]
-                    vertex3 = self.vertices[index[2]]
-
-                    transformed_vertex1 = projection_matrix @ translation_matrix @ rotation_matrix @ np.array(vertex1 + (1,))
-                    transformed_vertex1 = transformed_vertex1[:3] / transformed_vertex1[3]
-                    x1, y1 = int(transformed_vertex1[0] * self.width / 2 + self.width / 2), int(transformed_vertex1[1] * self.height / 2 + self.height / 2)
-
-                    transformed_vertex2 = projection_matrix @ translation_matrix @ rotation_matrix @ np.array(vertex2 + (1,))
-                    transformed_vertex2 = transformed_vertex2[:3] / transformed_vertex2[3]
-                    x2, y2 = int(transformed_vertex2[0] * self.width / 2 + self.width / 2), int(transformed_vertex2[1] * self.height / 2 + self.height / 2)
-
-                    transformed_vertex3 = projection_matrix @ translation_matrix @ rotation_matrix @ np.array(vertex3 + (1,))
-                    transformed_vertex3 = transformed_vertex3[:3] / transformed_vertex3[3]
-                    x3, y3 = int(transformed_vertex3[0] * self.width / 2 + self.width / 2), int(transformed_vertex3[1] * self.height / 2 + self.height / 2)
-
-                    pygame.draw.lines(self.screen, self.white, True, [(x1, y1), (x2, y2), (x3, y3)], 1)
-            else:
-                print('Incorrect disply mode for object, select : points or wireframe.')
-
-            self.draw_zoom_value()
-            pygame.display.flip()
+            # only re-project and redraw when the view actually changed
+            if self._dirty:
+                if self.ctx is not None:
+                    self.render_frame_gl(mode)
+                else:
+                    self.render_frame(mode)
+                pygame.display.flip()
+                self._dirty = False
             self.clock.tick(60)
 
         pygame.quit()